@@ -5,24 +5,129 @@ A Textual-based TUI for enhanced Terraform development workflow
 """
 
 import os
-import json
+import mmap
+import codecs
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 
 from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
-    Header, Footer, Button, Static, Tree, Label, 
+    Header, Footer, Button, Static, Tree, Label,
     Input, Select, Log, Progress, DataTable
 )
 from textual.reactive import reactive
 from textual.binding import Binding
 
+try:  # optional: SIMD-accelerated JSON parsing, falls back to stdlib
+    import orjson as _json
+except ImportError:
+    import json as _json
 
-@dataclass
+try:  # optional: on-demand plan parsing, skips materializing unused fields
+    import simdjson
+    _simdjson_parser = simdjson.Parser()
+except ImportError:
+    _simdjson_parser = None
+
+try:  # optional: incremental plan streaming, avoids buffering whole plans
+    import ijson
+except ImportError:
+    ijson = None
+
+_PROVIDER_KEYWORDS = (('azurerm', 'azure'), ('google', 'gcp'), ('aws', 'aws'))
+
+try:  # optional: single-pass multi-keyword scan for provider detection
+    import ahocorasick
+
+    _provider_automaton = ahocorasick.Automaton()
+    for _rank, (_keyword, _tag) in enumerate(_PROVIDER_KEYWORDS):
+        _provider_automaton.add_word(_keyword, (_rank, _tag))
+    _provider_automaton.make_automaton()
+except ImportError:
+    _provider_automaton = None
+
+
+def _detect_provider(data: Any) -> str:
+    """Find the provider keyword in a bytes-like .tf file buffer"""
+    if _provider_automaton is not None:
+        # One linear scan over the buffer. Matches arrive in file order,
+        # so rank them to keep the azurerm > google > aws priority of the
+        # fallback chain below. pyahocorasick's default build matches str,
+        # which costs one full copy/decode of the buffer on this path.
+        best = ""
+        best_rank = len(_PROVIDER_KEYWORDS)
+        text = bytes(data).decode('utf-8', 'ignore')
+        for _, (rank, tag) in _provider_automaton.iter(text):
+            if rank < best_rank:
+                best_rank, best = rank, tag
+                if rank == 0:
+                    break
+        return best
+    if data.find(b'azurerm') != -1:
+        return "azure"
+    if data.find(b'google') != -1:
+        return "gcp"
+    if data.find(b'aws') != -1:
+        return "aws"
+    return ""
+
+
+def _scan_tf_file(tf_file: Path) -> str:
+    """Scan a .tf file for its provider without copying it into memory"""
+    with open(tf_file, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _detect_provider(mm)
+        except ValueError:
+            # Empty files cannot be mapped
+            return ""
+
+
+def _module_of(address: str) -> str:
+    """Extract the module key from a resource address without a full split"""
+    if not address.startswith("module."):
+        return "root"
+    rest = address[7:]
+    head, sep, _ = rest.partition(".")
+    return "module." + head if sep else "root"
+
+
+# Action-to-emoji dispatch, precomputed once instead of per change
+_ACTION_EMOJI = {
+    'create': '🟢',
+    'delete': '🔴',
+    'replace': '🔵',
+    'update': '🟡',
+}
+
+# Destructive actions win when a change carries several (e.g. replace)
+_ACTION_PRIORITY = ('delete', 'replace', 'create', 'update')
+
+# Actions worth counting; filters out no-op/read entries
+_VALID_ACTIONS = frozenset(_ACTION_EMOJI)
+
+# Emoji memoized per actions tuple; plans repeat the same few
+# combinations across thousands of changes
+_EMOJI_FOR: Dict[Tuple[str, ...], str] = {}
+
+
+def _emoji_for(actions: List[str]) -> str:
+    """Pick the display emoji for a change's action list"""
+    if len(actions) == 1:
+        return _ACTION_EMOJI.get(actions[0], '⚪')
+    action_set = set(actions)
+    for action in _ACTION_PRIORITY:
+        if action in action_set:
+            return _ACTION_EMOJI[action]
+    return '⚪'
+
+
+@dataclass(slots=True)
 class TerraformConfig:
     """Terraform workspace configuration"""
     workdir: Path
@@ -40,65 +145,75 @@ class TerraformPlanTree(Tree):
     def __init__(self) -> None:
         super().__init__("📋 Plan Results")
         self.show_root = False
-        
+        self._change_counts: Counter = Counter()
+        self._module_nodes: Dict[str, Any] = {}
+        self._modules: Dict[str, List[str]] = {}
+        self._summary_node: Any = None
+        self._resources_node: Any = None
+
+    def start_plan(self) -> None:
+        """Reset the tree ready to receive resource changes"""
+        self.clear()
+        self._change_counts = Counter()
+        self._module_nodes = {}
+        self._modules = {}
+        self._summary_node = self.root.add("📊 Summary", expand=True)
+        self._resources_node = self.root.add("📦 Resource Changes", expand=True)
+
+    def add_change(self, change: Dict) -> None:
+        """Insert a single resource change as soon as it arrives"""
+        address = change['address']
+        actions = list(change.get('change', {}).get('actions', []))
+
+        # Counter.update runs the filter in one C-level loop
+        self._change_counts.update(a for a in actions if a in _VALID_ACTIONS)
+
+        module = _module_of(address)
+
+        module_node = self._module_nodes.get(module)
+        if module_node is None:
+            module_node = self._resources_node.add(
+                f"📁 {module}", data=module, expand=False
+            )
+            self._module_nodes[module] = module_node
+
+        actions_key = tuple(actions)
+        emoji = _EMOJI_FOR.get(actions_key)
+        if emoji is None:
+            emoji = _EMOJI_FOR[actions_key] = _emoji_for(actions)
+        label = emoji + ' ' + address
+
+        # Defer building child nodes until the module is actually opened
+        if module_node.is_expanded:
+            module_node.add(label)
+        else:
+            self._modules.setdefault(module, []).append(label)
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Build a module's children the first time its node opens"""
+        module = event.node.data
+        if module is None:
+            return
+        for label in self._modules.pop(module, ()):
+            event.node.add(label)
+
+    def finish_plan(self) -> None:
+        """Fill in the summary once all changes have been added"""
+        change_counts = self._change_counts
+        summary = self._summary_node
+        summary.add(f"🟢 Create: {change_counts.get('create', 0)}")
+        summary.add(f"🟡 Update: {change_counts.get('update', 0)}")
+        summary.add(f"🔴 Delete: {change_counts.get('delete', 0)}")
+        summary.add(f"🔵 Replace: {change_counts.get('replace', 0)}")
+
     def load_plan_data(self, plan_data: Dict) -> None:
         """Load and display terraform plan JSON data"""
-        self.clear()
-        
-        # Summary node
-        summary = self.root.add("📊 Summary", expand=True)
-        changes = plan_data.get('resource_changes', [])
-        
-        # Count changes by type
-        change_counts = {
-            'create': 0,
-            'update': 0, 
-            'delete': 0,
-            'replace': 0
-        }
-        
-        for change in changes:
-            actions = change.get('change', {}).get('actions', [])
-            for action in actions:
-                if action in change_counts:
-                    change_counts[action] += 1
-        
-        # Add summary labels with emojis
-        summary.add(f"🟢 Create: {change_counts['create']}")
-        summary.add(f"🟡 Update: {change_counts['update']}")
-        summary.add(f"🔴 Delete: {change_counts['delete']}")
-        summary.add(f"🔵 Replace: {change_counts['replace']}")
-        
-        # Resources by module
-        modules: Dict[str, Any] = {}
-        for change in changes:
-            address = change['address']
-            module = "root"
-            if address.startswith("module."):
-                module_parts = address.split(".")
-                module = ".".join(module_parts[:2])
-            
-            if module not in modules:
-                modules[module] = []
-            modules[module].append(change)
-        
-        # Add module nodes
-        resources_node = self.root.add("📦 Resource Changes", expand=True)
-        for module_name, changes in modules.items():
-            module_node = resources_node.add(f"📁 {module_name}", expand=False)
-            for change in changes:
-                actions = change['change']['actions']
-                emoji = "⚪"
-                if 'create' in actions:
-                    emoji = "🟢"
-                elif 'delete' in actions:
-                    emoji = "🔴"
-                elif 'replace' in actions:
-                    emoji = "🔵"
-                elif 'update' in actions:
-                    emoji = "🟡"
-                
-                module_node.add(f"{emoji} {change['address']}")
+        # One layout/refresh pass for the whole build, not one per node
+        with self.app.batch_update():
+            self.start_plan()
+            for change in plan_data.get('resource_changes', []):
+                self.add_change(change)
+            self.finish_plan()
 
 
 class TerraformStateTree(Tree):
@@ -107,55 +222,107 @@ class TerraformStateTree(Tree):
     def __init__(self) -> None:
         super().__init__("🌳 State")
         self.show_root = False
-        
+        self._resource_labels: Dict[str, List[str]] = {}
+
     def load_state_data(self, state_data: Dict) -> None:
         """Load and display terraform state JSON data"""
-        self.clear()
-        
-        if 'resources' not in state_data:
-            self.root.add("❌ No state data available")
+        # One layout/refresh pass for the whole build, not one per node
+        with self.app.batch_update():
+            self.clear()
+            self._resource_labels = {}
+
+            if 'resources' not in state_data:
+                self.root.add("❌ No state data available")
+                return
+
+            # One up-front sort keeps both the type groups and the
+            # resources within them alphabetical with no second pass
+            resources = sorted(
+                state_data['resources'],
+                key=lambda r: (r['type'], r.get('name', '')),
+            )
+
+            # Group by type
+            resource_types: Dict[str, List[Dict]] = defaultdict(list)
+            for resource in resources:
+                resource_types[resource['type']].append(resource)
+
+            # Only the type-group nodes are built up front; their resources
+            # are materialized on first expand
+            for resource_type, items in resource_types.items():
+                self.root.add(
+                    f"📦 {resource_type} ({len(items)})",
+                    data=resource_type,
+                    expand=False,
+                )
+                labels = []
+                for resource in items:
+                    name = resource.get('name', 'unknown')
+                    mode = resource.get('mode', 'managed')
+                    mode_icon = "🔧" if mode == "managed" else "📊"
+                    labels.append(f"{mode_icon} {name}")
+                self._resource_labels[resource_type] = labels
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Build a type group's children the first time its node opens"""
+        resource_type = event.node.data
+        if resource_type is None:
             return
-            
-        resources = state_data['resources']
-        
-        # Group by type
-        resource_types = {}
-        for resource in resources:
-            resource_type = resource['type']
-            if resource_type not in resource_types:
-                resource_types[resource_type] = []
-            resource_types[resource_type].append(resource)
-        
-        # Build tree
-        for resource_type, items in resource_types.items():
-            type_node = self.root.add(f"📦 {resource_type} ({len(items)})", expand=False)
-            for resource in items:
-                name = resource.get('name', 'unknown')
-                mode = resource.get('mode', 'managed')
-                mode_icon = "🔧" if mode == "managed" else "📊"
-                type_node.add(f"{mode_icon} {name}")
+        for label in self._resource_labels.pop(resource_type, ()):
+            event.node.add(label)
 
 
 class StatusHeader(Static):
     """Custom header showing Terraform context"""
-    
-    config = reactive(TerraformConfig)
-    
+
+    # Per-field reactives: assigning an unchanged value is a cheap
+    # compare, so only fields that really changed trigger a repaint
+    provider_info = reactive("Not detected")
+    var_info = reactive("No var file")
+    state_info = reactive("State: local")
+    init_status = reactive("✗")
+    workdir_name = reactive("")
+
     def __init__(self, config: TerraformConfig) -> None:
         super().__init__()
         self.config = config
-        
+        self._cache_key: Optional[Tuple[str, str, str, str, str]] = None
+        self._cache_val = ""
+        self.update_config(config)
+
+    def update_config(self, config: TerraformConfig) -> None:
+        """Push config changes into the reactive fields"""
+        self.config = config
+        self.provider_info = (
+            f"{config.provider}: {config.subscription_id}"
+            if config.provider else "Not detected"
+        )
+        self.var_info = (
+            f"tfvars: {config.var_file}" if config.var_file else "No var file"
+        )
+        self.state_info = f"State: {config.state_backend}"
+        self.init_status = "✓" if config.initialized else "✗"
+        self.workdir_name = config.workdir.name
+
     def render(self) -> str:
-        provider_info = f"{self.config.provider}: {self.config.subscription_id}" if self.config.provider else "Not detected"
-        var_info = f"tfvars: {self.config.var_file}" if self.config.var_file else "No var file"
-        state_info = f"State: {self.config.state_backend}"
-        init_status = "✓" if self.config.initialized else "✗"
-        
-        return (
-            f"┌─ tf-textual ─[{provider_info}]─[{var_info}]─[{state_info}]─[Init:{init_status}]─┐\n"
+        # A tuple compare replaces three f-string builds on repaints
+        # where nothing changed
+        key = (
+            self.provider_info,
+            self.var_info,
+            self.state_info,
+            self.init_status,
+            self.workdir_name,
+        )
+        if key == self._cache_key:
+            return self._cache_val
+        self._cache_key = key
+        self._cache_val = (
+            f"┌─ tf-textual ─[{self.provider_info}]─[{self.var_info}]─[{self.state_info}]─[Init:{self.init_status}]─┐\n"
             f"│ [Init] [Plan] [Apply] [Refresh] [Config] [Auth]                               │\n"
-            f"├──────────────── Current workdir: {self.config.workdir.name} ──────────────────┤"
+            f"├──────────────── Current workdir: {self.workdir_name} ──────────────────┤"
         )
+        return self._cache_val
 
 
 class TerraformOutput(Log):
@@ -246,6 +413,7 @@ class TFTextualApp(App):
     def __init__(self, workdir: Optional[Path] = None) -> None:
         super().__init__()
         self.workdir = workdir or Path.cwd()
+        self._tf_cache: Dict[Path, Tuple[float, str]] = {}
         self.config = self.detect_environment()
         self.plan_tree = TerraformPlanTree()
         self.state_tree = TerraformStateTree()
@@ -254,25 +422,35 @@ class TFTextualApp(App):
     def detect_environment(self) -> TerraformConfig:
         """Auto-detect Terraform environment configuration"""
         config = TerraformConfig(workdir=self.workdir)
-        
-        # Detect .tfvars files
-        tfvars_files = list(self.workdir.glob("*.tfvars"))
-        if tfvars_files:
-            config.var_file = tfvars_files[0].name
-            
-        # Detect provider
-        for tf_file in self.workdir.glob("*.tf"):
-            content = tf_file.read_text()
-            if 'azurerm' in content:
-                config.provider = "azure"
-            elif 'google' in content:
-                config.provider = "gcp"
-            elif 'aws' in content:
-                config.provider = "aws"
-                
-        # Check if initialized
-        config.initialized = (self.workdir / ".terraform").exists()
-        
+
+        # One directory read classifies everything we care about: the
+        # first .tfvars file, the .tf files, and the .terraform marker
+        tf_files: List[Path] = []
+        with os.scandir(self.workdir) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    if name == ".terraform":
+                        config.initialized = True
+                    continue
+                if name.endswith(".tfvars") and config.var_file is None:
+                    config.var_file = name
+                elif name.endswith(".tf"):
+                    tf_files.append(Path(entry.path))
+
+        # Detect provider, re-scanning only .tf files that changed on disk
+        for tf_file in tf_files:
+            st = tf_file.stat()
+            cached = self._tf_cache.get(tf_file)
+            if cached is not None and cached[0] == st.st_mtime:
+                provider = cached[1]
+            else:
+                provider = _scan_tf_file(tf_file)
+                self._tf_cache[tf_file] = (st.st_mtime, provider)
+            if provider:
+                config.provider = provider
+                break
+
         return config
         
     def compose(self) -> ComposeResult:
@@ -298,16 +476,22 @@ class TFTextualApp(App):
         
     async def load_current_state(self) -> None:
         """Load current Terraform state"""
+        state_file = self.workdir / "terraform.tfstate"
         try:
-            # Try to load state file
-            state_file = self.workdir / "terraform.tfstate"
-            if state_file.exists():
-                state_data = json.loads(state_file.read_text())
-                self.state_tree.load_state_data(state_data)
-                self.output.write("✅ Loaded current state")
-            else:
-                self.output.write("⚠️ No state file found")
-                
+            # One syscall: no exists() probe before the read
+            data = state_file.read_bytes()
+        except FileNotFoundError:
+            self.output.write("⚠️ No state file found")
+            return
+        except OSError as e:
+            self.output.write(f"❌ Error loading state: {e}")
+            return
+
+        try:
+            # Parse off the event loop so the UI keeps painting
+            state_data = await asyncio.to_thread(_json.loads, data)
+            self.state_tree.load_state_data(state_data)
+            self.output.write("✅ Loaded current state")
         except Exception as e:
             self.output.write(f"❌ Error loading state: {e}")
             
@@ -317,7 +501,7 @@ class TFTextualApp(App):
         self.output.write("🚀 Initializing Terraform...")
         await self.run_terraform_command(["init"])
         self.config.initialized = True
-        self.query_one(StatusHeader).refresh()
+        self.query_one(StatusHeader).update_config(self.config)
         
     @on(Button.Pressed, "#plan-btn") 
     async def on_plan(self) -> None:
@@ -352,7 +536,7 @@ class TFTextualApp(App):
         self.output.write("🔄 Refreshing...")
         await self.load_current_state()
         self.config = self.detect_environment()
-        self.query_one(StatusHeader).refresh()
+        self.query_one(StatusHeader).update_config(self.config)
         
     async def run_terraform_command(self, args: List[str]) -> None:
         """Run terraform command and capture output"""
@@ -364,13 +548,38 @@ class TFTextualApp(App):
                 stderr=asyncio.subprocess.STDOUT
             )
             
+            # Read in large chunks and flush each chunk's lines in one
+            # widget update: bursts of output repaint once per chunk, while
+            # a slow trickle still appears as soon as it arrives. A single
+            # incremental decoder handles multibyte chars split across chunks.
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            pending = ""
             while True:
-                output = await process.stdout.readline()
-                if not output:
+                chunk = await process.stdout.read(65536)
+                if not chunk:
                     break
-                line = output.decode().strip()
-                self.output.write(line)
-                
+                pending += decoder.decode(chunk)
+                if pending.endswith("\r"):
+                    # May be the first half of a \r\n split across chunks;
+                    # hold it so the \n doesn't become a spurious blank line
+                    pending = pending[:-1]
+                    carry = "\r"
+                else:
+                    carry = ""
+                lines = pending.splitlines()
+                if pending.endswith("\n"):
+                    pending = carry
+                elif lines:
+                    pending = lines.pop() + carry
+                else:
+                    pending = carry
+                if lines:
+                    self.output.write_lines(lines)
+
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                self.output.write_lines(pending.splitlines())
+
             await process.wait()
             
         except Exception as e:
@@ -386,11 +595,29 @@ class TFTextualApp(App):
                 stdout=asyncio.subprocess.PIPE
             )
             
-            output, _ = await process.communicate()
-            plan_data = json.loads(output.decode())
-            
-            # Update plan tree
-            self.plan_tree.load_plan_data(plan_data)
+            if ijson is not None:
+                # Stream changes into the tree as terraform emits them;
+                # peak memory stays at one change instead of the whole plan
+                self.plan_tree.start_plan()
+                async for change in ijson.items(
+                    process.stdout, 'resource_changes.item'
+                ):
+                    self.plan_tree.add_change(change)
+                self.plan_tree.finish_plan()
+                await process.wait()
+            else:
+                output, _ = await process.communicate()
+                if _simdjson_parser is not None:
+                    # Lazy proxies: only the addresses/actions the tree reads
+                    # get converted to Python objects, not before/after blobs
+                    plan_data = await asyncio.to_thread(
+                        _simdjson_parser.parse, output
+                    )
+                else:
+                    # Parse off the event loop so the UI keeps painting
+                    plan_data = await asyncio.to_thread(_json.loads, output)
+                self.plan_tree.load_plan_data(plan_data)
+
             self.output.write("✅ Plan loaded successfully")
             
         except Exception as e: